@@ -7,6 +7,10 @@ import subprocess
 import signal
 import sys
 import os
+import unicodedata
+import functools
+import math
+import collections
 
 SNAKE_CHAR = '██'
 APPLE_CHAR = '🍏'
@@ -17,13 +21,30 @@ SOUND_CMD = ['paplay', '/usr/share/sounds/freedesktop/stereo/bell.oga']
 LEADERBOARD_FILE = "leaderboard.txt"
 MAX_NAME_LEN = 12
 MAX_LEADERBOARD_ENTRIES = 5
-
+BORDER_CHARS = ('─', '│', '┌', '┐', '└', '┘')
+SYNC_BEGIN = '\x1b[?2026h'  # synchronized output: hold drawing until SYNC_END
+SYNC_END = '\x1b[?2026l'
+
+# figlet -f standard pysnake, used when figlet isn't installed
+TITLE_BANNER = (
+    "                             _        ",
+    " _ __  _   _ ___ _ __   __ _| | _____ ",
+    "| '_ \\| | | / __| '_ \\ / _` | |/ / _ \\",
+    "| |_) | |_| \\__ \\ | | | (_| |   <  __/",
+    "| .__/ \\__, |___/_| |_|\\__,_|_|\\_\\___|",
+    "|_|    |___/                          ",
+)
+
+# Board positions are (row, column) in segment units; a column is
+# SEGMENT_WIDTH screen cells wide and is only scaled up when drawn
 DIRECTIONS = {
     'up': (-1, 0),
     'down': (1, 0),
-    'left': (0, -SEGMENT_WIDTH),
-    'right': (0, SEGMENT_WIDTH),
+    'left': (0, -1),
+    'right': (0, 1),
 }
+DIRECTION_NAMES = tuple(DIRECTIONS)
+DIRECTION_VECS = tuple(DIRECTIONS.values())
 
 KEY_DIRECTION_MAP = {
     curses.KEY_UP: 'up',
@@ -41,6 +62,7 @@ def init_colors():
     curses.use_default_colors()
     for i in range(1, 8):
         curses.init_pair(i, i, -1)
+        curses.init_pair(20 + i, i, -1)  # apple colors
     curses.init_pair(10, curses.COLOR_GREEN, -1)  # snake color default
     curses.init_pair(30, curses.COLOR_RED, -1)    # obstacle color default
 
@@ -48,56 +70,217 @@ def random_color(exclude=[]):
     choices = [i for i in range(1, 8) if i not in exclude]
     return random.choice(choices)
 
-def play_sound():
-    subprocess.Popen(SOUND_CMD, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+_sound_proc = None
 
-def random_empty_position(sh, sw, snake, apples, obstacles):
-    min_y, max_y = 1, sh - 2
-    max_x = sw - SEGMENT_WIDTH - 1
-    possible_x = [x for x in range(SEGMENT_WIDTH, max_x, SEGMENT_WIDTH)]
-    while True:
-        y = random.randint(min_y, max_y)
-        x = random.choice(possible_x)
-        pos = [y, x]
-        if pos not in snake and pos not in apples and pos not in obstacles:
-            return pos
+def play_sound():
+    # Skip the sound if the last one is still playing; poll() also reaps it
+    global _sound_proc
+    if _sound_proc is not None and _sound_proc.poll() is None:
+        return
+    _sound_proc = subprocess.Popen(SOUND_CMD, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+@functools.lru_cache(maxsize=4)
+def board_cells(sh, sw):
+    # Columns whose segment starts left of sw - SEGMENT_WIDTH - 1
+    max_x = (sw - SEGMENT_WIDTH - 2) // SEGMENT_WIDTH + 1
+    return tuple((y, x) for y in range(1, sh - 1) for x in range(1, max_x))
+
+@functools.lru_cache(maxsize=4)
+def border_cells(sh, sw):
+    # Cells just outside the play area that a head can step into from inside
+    # it, so hitting the border is a set lookup like any other collision
+    y_max = sh - 1
+    x_max = (sw - SEGMENT_WIDTH - 1) // SEGMENT_WIDTH
+    xs = range(x_max + 2)
+    cells = {(0, x) for x in xs} | {(y_max, x) for x in xs}
+    for y in range(y_max + 1):
+        cells.add((y, 0))
+        cells.add((y, x_max + 1))
+    return frozenset(cells)
+
+def random_empty_position(sh, sw, snake_set, apple_set, obstacle_set):
+    # Occupancy is passed as sets of (y, x) tuples so each probe is a hash lookup
+    cells = board_cells(sh, sw)
+    occupied = len(snake_set) + len(apple_set) + len(obstacle_set)
+    if occupied * 2 < len(cells):
+        # Mostly empty board, so a few random probes will find a free cell
+        while True:
+            pos = random.choice(cells)
+            if pos not in snake_set and pos not in apple_set and pos not in obstacle_set:
+                return pos
+    free = [pos for pos in cells if pos not in snake_set and pos not in apple_set and pos not in obstacle_set]
+    # None when the board is full; callers skip the spawn
+    return random.choice(free) if free else None
 
 def initialize_snake(sh, sw, direction, length=3):
     mid_y = sh // 2
-    mid_x = (sw // 2 // SEGMENT_WIDTH) * SEGMENT_WIDTH
+    mid_x = sw // 2 // SEGMENT_WIDTH
     dy, dx = DIRECTIONS[direction]
 
-    snake = []
+    # Head first; a deque so moving is O(1) at both ends
+    snake = collections.deque()
     for i in range(length):
         y = mid_y - dy * i
         x = mid_x - dx * i
         y = max(1, min(sh - 2, y))
-        x = max(SEGMENT_WIDTH, min(sw - SEGMENT_WIDTH * 2, x))
-        snake.append([y, x])
+        x = max(1, min((sw - SEGMENT_WIDTH * 2) // SEGMENT_WIDTH, x))
+        snake.append((y, x))
     return snake
 
-def draw_figlet_text(stdscr, text_lines, start_y, start_x, color_pair):
+def char_width(ch):
+    return 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+
+# A frame is a grid of (char, attr) cells that gets built up in memory and
+# then written to the screen in one pass. Wide characters take their own cell
+# plus an empty continuation cell so columns stay aligned.
+def new_frame(sh, sw):
+    return [[(' ', 0)] * sw for _ in range(sh)]
+
+def frame_put(frame, y, x, text, attr=0):
+    if y < 0 or y >= len(frame):
+        return
+    row = frame[y]
+    x = max(0, x)
+    for ch in text:
+        width = char_width(ch)
+        if x + width > len(row):
+            break
+        # Overwriting half of a wide character blanks its other half,
+        # the same as the terminal will
+        if row[x][0] == '' and x > 0:
+            row[x - 1] = (' ', row[x - 1][1])
+        if x + width < len(row) and row[x + width][0] == '':
+            row[x + width] = (' ', row[x + width][1])
+        row[x] = (ch, attr)
+        if width == 2:
+            row[x + 1] = ('', attr)
+        x += width
+
+def frame_cells(frame, cells, char, attr=0):
+    # Board positions to screen cells
+    for y, x in cells:
+        frame_put(frame, y, x * SEGMENT_WIDTH, char, attr)
+
+def frame_border(frame, attr=0):
+    sh, sw = len(frame), len(frame[0])
+    hline, vline, tl, tr, bl, br = BORDER_CHARS
+    frame_put(frame, 0, 0, tl + hline * (sw - 2) + tr, attr)
+    for y in range(1, sh - 1):
+        frame[y][0] = (vline, attr)
+        frame[y][sw - 1] = (vline, attr)
+    frame_put(frame, sh - 1, 0, bl + hline * (sw - 2) + br, attr)
+
+def write_run(stdscr, y, x, run, attr):
+    try:
+        stdscr.addstr(y, x, ''.join(run), attr)
+    except curses.error:
+        # Writing the bottom-right cell moves the cursor off screen
+        pass
+
+@functools.lru_cache(maxsize=1)
+def synchronized_output():
+    # Newer terminfo entries advertise mode 2026 with the Sync extension.
+    # Otherwise go by COLORTERM, which the terminals that support it set;
+    # terminals without it ignore the unknown private mode anyway.
+    try:
+        if curses.tigetstr('Sync'):
+            return True
+    except curses.error:
+        pass
+    return os.environ.get('COLORTERM') in ('truecolor', '24bit')
+
+def flush_frame(stdscr, frame, prev_frame=None):
+    # Only cells that differ from prev_frame are written, one addstr per run
+    # of neighbouring changed cells that share an attribute. Without a
+    # previous frame every cell is written.
+    changed = False
+    for y, row in enumerate(frame):
+        prev_row = prev_frame[y] if prev_frame is not None else None
+        if row is prev_row or row == prev_row:
+            continue
+        changed = True
+        run_x, run_attr = None, 0
+        run = []
+        for x, cell in enumerate(row):
+            if prev_row is not None and cell == prev_row[x]:
+                if run:
+                    write_run(stdscr, y, run_x, run, run_attr)
+                    run = []
+                continue
+            ch, attr = cell
+            if run and attr != run_attr:
+                write_run(stdscr, y, run_x, run, run_attr)
+                run = []
+            if not run:
+                run_x, run_attr = x, attr
+                if ch == '' and x > 0:
+                    # Start from the wide character this cell belongs to
+                    run_x = x - 1
+                    run.append(row[x - 1][0])
+            run.append(ch)
+        if run:
+            write_run(stdscr, y, run_x, run, run_attr)
+    if changed and synchronized_output():
+        # Have the terminal apply the whole frame at once so it never shows
+        # a half-drawn one
+        sys.stdout.write(SYNC_BEGIN)
+        sys.stdout.flush()
+        stdscr.refresh()
+        sys.stdout.write(SYNC_END)
+        sys.stdout.flush()
+    else:
+        stdscr.refresh()
+
+@functools.lru_cache(maxsize=4)
+def figlet_lines(text, font='standard'):
+    try:
+        figlet_proc = subprocess.run(['figlet', '-f', font, text], capture_output=True, text=True)
+        lines = figlet_proc.stdout.splitlines()
+    except OSError:
+        lines = []
+    if not lines:
+        lines = TITLE_BANNER if text == 'pysnake' else [text]
+    return tuple(lines)
+
+def draw_figlet_text(frame, text_lines, start_y, start_x, color_pair):
     for i, line in enumerate(text_lines):
-        stdscr.attron(curses.color_pair(color_pair))
-        stdscr.addstr(start_y + i, start_x, line)
-        stdscr.attroff(curses.color_pair(color_pair))
+        frame_put(frame, start_y + i, start_x, line, curses.color_pair(color_pair))
+
+# Parsed leaderboard and the file mtime it was read at
+_leaderboard_cache = []
+_leaderboard_mtime = None
 
 def load_leaderboard():
-    if not os.path.exists(LEADERBOARD_FILE):
+    global _leaderboard_cache, _leaderboard_mtime
+    try:
+        mtime = os.stat(LEADERBOARD_FILE).st_mtime_ns
+    except FileNotFoundError:
         return []
-    entries = []
-    with open(LEADERBOARD_FILE, "r") as f:
-        for line in f:
-            parts = line.rstrip("\n").split('\t')
-            if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
-                entries.append((parts[0], int(parts[1]), int(parts[2])))
-    entries.sort(key=lambda x: (-x[1], x[2]))
-    return entries[:MAX_LEADERBOARD_ENTRIES]
+    if mtime != _leaderboard_mtime:
+        entries = []
+        with open(LEADERBOARD_FILE, "r") as f:
+            for line in f:
+                parts = line.rstrip("\n").split('\t')
+                if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+                    entries.append((parts[0], int(parts[1]), int(parts[2])))
+        entries.sort(key=lambda x: (-x[1], x[2]))
+        _leaderboard_cache = entries[:MAX_LEADERBOARD_ENTRIES]
+        _leaderboard_mtime = mtime
+    return list(_leaderboard_cache)
+
+def invalidate_leaderboard():
+    global _leaderboard_mtime
+    _leaderboard_mtime = None
 
 def save_leaderboard(entries):
-    with open(LEADERBOARD_FILE, "w") as f:
-        for name, score, elapsed in entries[:MAX_LEADERBOARD_ENTRIES]:
-            f.write(f"{name}\t{score}\t{elapsed}\n")
+    # Written in one go to a temporary file and swapped in, so a crash
+    # mid-save can't leave a truncated leaderboard behind
+    text = "".join(f"{name}\t{score}\t{elapsed}\n" for name, score, elapsed in entries[:MAX_LEADERBOARD_ENTRIES])
+    tmp_file = LEADERBOARD_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        f.write(text)
+    os.replace(tmp_file, LEADERBOARD_FILE)
+    invalidate_leaderboard()
 
 def add_score_to_leaderboard(name, score, elapsed):
     entries = load_leaderboard()
@@ -109,28 +292,26 @@ def add_score_to_leaderboard(name, score, elapsed):
 def clear_leaderboard():
     if os.path.exists(LEADERBOARD_FILE):
         os.remove(LEADERBOARD_FILE)
+    invalidate_leaderboard()
 
 def ask_name(stdscr):
     stdscr.clear()
-    stdscr.refresh()
-    curses.echo()
     curses.curs_set(1)
     stdscr.nodelay(False)
 
     sh, sw = stdscr.getmaxyx()
     prompt = f"New High Score! Enter your name (max {MAX_NAME_LEN} chars): "
     stdscr.addstr(sh // 2, max(0, sw // 2 - len(prompt) // 2), prompt)
-    stdscr.refresh()
 
+    # The name is typed straight onto stdscr; each key only rewrites the
+    # cell it changes and getch() refreshes the screen
     win_y = sh // 2 + 1
     win_x = max(0, sw // 2 - MAX_NAME_LEN // 2)
-    win = curses.newwin(1, MAX_NAME_LEN + 1, win_y, win_x)
-    win.keypad(True)
-    win.refresh()
+    stdscr.move(win_y, win_x)
 
     box = ''
     while True:
-        ch = win.getch()
+        ch = stdscr.getch()
         if ch in (curses.KEY_ENTER, 10, 13):
             break
         elif ch in (27,):
@@ -139,43 +320,37 @@ def ask_name(stdscr):
         elif ch in (curses.KEY_BACKSPACE, 127, 8):
             if len(box) > 0:
                 box = box[:-1]
-                win.clear()
-                win.addstr(0, 0, box)
-                win.refresh()
+                stdscr.addstr(win_y, win_x + len(box), ' ')
+                stdscr.move(win_y, win_x + len(box))
         elif 32 <= ch <= 126 and len(box) < MAX_NAME_LEN:
+            stdscr.addstr(win_y, win_x + len(box), chr(ch))
             box += chr(ch)
-            win.addstr(0, len(box) - 1, chr(ch))
-            win.refresh()
 
-    curses.noecho()
     curses.curs_set(0)
     stdscr.clear()
     stdscr.refresh()
     return box.strip() if box.strip() else "Anonymous"
 
-def draw_leaderboard(stdscr, start_y, sw):
+def draw_leaderboard(frame, start_y, sw):
     entries = load_leaderboard()
     if not entries:
         return
-    stdscr.attron(curses.A_BOLD)
-    stdscr.addstr(start_y, sw // 2 - 12, "LEADERBOARD (Score | Time)")
-    stdscr.attroff(curses.A_BOLD)
+    frame_put(frame, start_y, sw // 2 - 12, "LEADERBOARD (Score | Time)", curses.A_BOLD)
     for i, (name, score, elapsed) in enumerate(entries):
         mins = elapsed // 60
         secs = elapsed % 60
         time_str = f"{mins:02d}:{secs:02d}"
         line = f"{i+1}. {name[:MAX_NAME_LEN]:<{MAX_NAME_LEN}} {score:>3}  {time_str}"
-        stdscr.addstr(start_y + i + 1, sw // 2 - len(line)//2, line)
+        frame_put(frame, start_y + i + 1, sw // 2 - len(line)//2, line)
 
 def title_screen(stdscr, sound_on):
     sh, sw = stdscr.getmaxyx()
     init_colors()
 
-    figlet_proc = subprocess.run(['figlet', '-f', 'standard', 'pysnake'], capture_output=True, text=True)
-    figlet_lines = figlet_proc.stdout.splitlines()
+    title_lines = figlet_lines('pysnake')
 
-    figlet_height = len(figlet_lines)
-    figlet_width = max(len(line) for line in figlet_lines)
+    figlet_height = len(title_lines)
+    figlet_width = max(len(line) for line in title_lines)
     start_y = max(0, sh // 2 - figlet_height // 2 - 8)
     start_x = max(0, sw // 2 - figlet_width // 2)
 
@@ -186,23 +361,33 @@ def title_screen(stdscr, sound_on):
     demo_direction = 'right'
     demo_dir_vec = DIRECTIONS[demo_direction]
     demo_snake = initialize_snake(sh, sw, demo_direction, length=5)
+    # Segments per cell; reversing into the neck can stack two on one cell,
+    # so a cell only frees up once its count drops to zero
+    demo_snake_cells = collections.Counter(demo_snake)
 
     demo_obstacles = []
+    demo_obstacle_set = set()
+
+    # Apple colors keyed by (y, x)
+    demo_apples = {}
 
-    def make_demo_apple(snake_and_apples_and_obstacles):
-        pos = random_empty_position(sh, sw, snake_and_apples_and_obstacles, [], demo_obstacles)
-        color = random_color()
-        return [pos[0], pos[1], color]
+    def add_demo_apple():
+        pos = random_empty_position(sh, sw, demo_snake_cells, demo_apples.keys(), demo_obstacle_set)
+        if pos is not None:
+            demo_apples[pos] = random_color()
 
-    demo_apples = []
     for _ in range(10):
-        demo_apples.append(make_demo_apple(demo_snake + demo_apples))
+        add_demo_apple()
 
     while len(demo_obstacles) < 4:
-        pos = random_empty_position(sh, sw, demo_snake + [a[:2] for a in demo_apples], [], demo_obstacles)
+        pos = random_empty_position(sh, sw, demo_snake_cells, demo_apples.keys(), demo_obstacle_set)
+        if pos is None:
+            break
         demo_obstacles.append(pos)
+        demo_obstacle_set.add(pos)
 
     stdscr.nodelay(True)
+    prev_frame = None
 
     while True:
         key = stdscr.getch()
@@ -215,54 +400,47 @@ def title_screen(stdscr, sound_on):
         elif key != -1:
             break
 
-        head = [demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1]]
+        head = (demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1])
 
         if random.random() < 0.2:
-            demo_direction = random.choice(list(DIRECTIONS.keys()))
-            demo_dir_vec = DIRECTIONS[demo_direction]
-            head = [demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1]]
+            demo_dir_vec = random.choice(DIRECTION_VECS)
+            head = (demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1])
 
         collision = (
-            head in demo_snake or
+            head in demo_snake_cells or
             head[0] <= 0 or head[0] >= sh - 1 or
-            head[1] <= 0 or head[1] > sw - SEGMENT_WIDTH - 1 or
-            head in demo_obstacles
+            head[1] <= 0 or head[1] > (sw - SEGMENT_WIDTH - 1) // SEGMENT_WIDTH or
+            head in demo_obstacle_set
         )
         if collision:
             demo_dir_vec = (-demo_dir_vec[0], -demo_dir_vec[1])
-            head = [demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1]]
+            head = (demo_snake[0][0] + demo_dir_vec[0], demo_snake[0][1] + demo_dir_vec[1])
 
-        demo_snake.insert(0, head)
+        demo_snake.appendleft(head)
+        demo_snake_cells[head] += 1
 
-        ate_apple_idx = next((i for i, a in enumerate(demo_apples) if a[0] == head[0] and a[1] == head[1]), None)
-        if ate_apple_idx is not None:
-            demo_apples[ate_apple_idx] = make_demo_apple(demo_snake + demo_apples)
+        if demo_apples.pop(head, None) is not None:
+            add_demo_apple()
         else:
-            demo_snake.pop()
-
-        stdscr.erase()
-        stdscr.attron(curses.color_pair(15))
-        stdscr.border()
-        stdscr.attroff(curses.color_pair(15))
+            tail = demo_snake.pop()
+            demo_snake_cells[tail] -= 1
+            if not demo_snake_cells[tail]:
+                del demo_snake_cells[tail]
 
-        for apple in demo_apples:
-            y, x, color = apple
-            curses.init_pair(20 + color, color, -1)
-            stdscr.attron(curses.color_pair(20 + color))
-            stdscr.addstr(y, x, APPLE_CHAR)
-            stdscr.attroff(curses.color_pair(20 + color))
+        frame = new_frame(sh, sw)
+        frame_border(frame, curses.color_pair(15))
 
-        stdscr.attron(curses.color_pair(30))
-        for y, x in demo_obstacles:
-            stdscr.addstr(y, x, OBSTACLE_CHAR)
-        stdscr.attroff(curses.color_pair(30))
+        # Group apples by color so each color's attribute is looked up once
+        apples_by_color = collections.defaultdict(list)
+        for pos, color in demo_apples.items():
+            apples_by_color[color].append(pos)
+        for color, cells in apples_by_color.items():
+            frame_cells(frame, cells, APPLE_CHAR, curses.color_pair(20 + color))
 
-        stdscr.attron(curses.color_pair(15))
-        for y, x in demo_snake:
-            stdscr.addstr(y, x, SNAKE_CHAR)
-        stdscr.attroff(curses.color_pair(15))
+        frame_cells(frame, demo_obstacles, OBSTACLE_CHAR, curses.color_pair(30))
+        frame_cells(frame, demo_snake, SNAKE_CHAR, curses.color_pair(15))
 
-        draw_figlet_text(stdscr, figlet_lines, start_y, start_x, title_color)
+        draw_figlet_text(frame, title_lines, start_y, start_x, title_color)
 
         start_msg = "Press any key to start"
         quit_msg = "Press Q to exit"
@@ -270,21 +448,19 @@ def title_screen(stdscr, sound_on):
         sound_msg = f"Sound: {'ON' if sound_on else 'OFF'} (Press O to toggle)"
         controls_msg = "Use arrow keys or WASD to move — Hold key to move faster"
 
-        stdscr.attron(curses.color_pair(title_color) | curses.A_BOLD)
-        stdscr.addstr(start_y + figlet_height + 1, sw // 2 - len(start_msg) // 2, start_msg)
-        stdscr.addstr(start_y + figlet_height + 2, sw // 2 - len(quit_msg) // 2, quit_msg)
-        stdscr.addstr(start_y + figlet_height + 3, sw // 2 - len(clear_msg) // 2, clear_msg)
-        stdscr.attroff(curses.color_pair(title_color) | curses.A_BOLD)
+        msg_attr = curses.color_pair(title_color) | curses.A_BOLD
+        frame_put(frame, start_y + figlet_height + 1, sw // 2 - len(start_msg) // 2, start_msg, msg_attr)
+        frame_put(frame, start_y + figlet_height + 2, sw // 2 - len(quit_msg) // 2, quit_msg, msg_attr)
+        frame_put(frame, start_y + figlet_height + 3, sw // 2 - len(clear_msg) // 2, clear_msg, msg_attr)
 
-        stdscr.attron(curses.color_pair(7))
-        stdscr.addstr(start_y + figlet_height + 5, sw // 2 - len(controls_msg) // 2, controls_msg)
-        stdscr.addstr(start_y + figlet_height + 6, sw // 2 - len(sound_msg) // 2, sound_msg)
-        stdscr.attroff(curses.color_pair(7))
+        frame_put(frame, start_y + figlet_height + 5, sw // 2 - len(controls_msg) // 2, controls_msg, curses.color_pair(7))
+        frame_put(frame, start_y + figlet_height + 6, sw // 2 - len(sound_msg) // 2, sound_msg, curses.color_pair(7))
 
-        draw_leaderboard(stdscr, start_y + figlet_height + 8, sw)
+        draw_leaderboard(frame, start_y + figlet_height + 8, sw)
         made_by = "made by: takardo"
-        stdscr.addstr(sh - 1, sw - len(made_by) - 1, made_by)
-        stdscr.refresh()
+        frame_put(frame, sh - 1, sw - len(made_by) - 1, made_by)
+        flush_frame(stdscr, frame, prev_frame)
+        prev_frame = frame
         time.sleep(0.15)
 
     return sound_on
@@ -312,10 +488,11 @@ def run_game(stdscr, sound_on_initial=True):
     base_delay = 0.2
     min_delay = 0.032
 
-    direction = random.choice(list(DIRECTIONS.keys()))
+    direction = random.choice(DIRECTION_NAMES)
     dir_vec = DIRECTIONS[direction]
 
     snake = initialize_snake(sh, sw, direction)
+    snake_set = set(snake)
 
     score = 0
     start_time = time.time()
@@ -325,10 +502,49 @@ def run_game(stdscr, sound_on_initial=True):
     last_move_time = time.time()
     last_draw_time = time.time()
     timer_refresh_interval = 1 / 60
+    move_delay = base_delay  # only changes with the score
+    current_delay = move_delay
     speed_boost = False
+    prev_frame = None
+    dirty = True  # snake, apples or obstacles changed since the last draw
+
+    border_attr = curses.color_pair(10)  # border same color as snake
+    hud_attr = curses.color_pair(10) | curses.A_BOLD
+    pause_msg = "Paused — press 'p' to resume"
+
+    y_max = x_max = pause_y = pause_x = 0
+    top_border = []
+    border = frozenset()
 
-    apples = []
+    def update_layout():
+        # Everything here depends only on the terminal size, so it's worked
+        # out once and again on resize rather than on every loop
+        nonlocal sh, sw, y_max, x_max, pause_y, pause_x, top_border, border
+        sh, sw = stdscr.getmaxyx()
+        y_max = sh - 1
+        x_max = (sw - SEGMENT_WIDTH - 1) // SEGMENT_WIDTH
+        border = border_cells(sh, sw)
+        pause_y = sh // 2
+        pause_x = sw // 2 - len(pause_msg) // 2
+        border_frame = new_frame(sh, sw)
+        frame_border(border_frame, border_attr)
+        top_border = border_frame[0]
+
+    update_layout()
+
+    # HUD text that only changes with the score or sound setting; reset to
+    # None to have it rebuilt on the next draw
+    score_str = None
+    controls_str = None
+    left_pos = 2
+
+    apples = {}  # (y, x) -> {'color': ..., 'special': ...}
+    normal_apple_count = 0
+    special_apple_present = False
     obstacles = []
+    obstacle_set = set()
+    # Every cell that ends the game: border, obstacles and the snake itself
+    blocked = set(border) | snake_set
 
     grow_segments = 0  # <--- Initialize grow_segments here
 
@@ -357,160 +573,208 @@ def run_game(stdscr, sound_on_initial=True):
             return 6
 
     def spawn_apples_and_obstacles():
+        # The apple counters are kept up to date by the caller when an apple
+        # is eaten, so this only does work when something needs adding
+        nonlocal normal_apple_count, special_apple_present
         apple_count = get_apple_count(score)
         obstacle_count = get_obstacle_count(score)
 
         # Remove excess normal apples (not special)
-        normal_apples = [a for a in apples if not a.get('special', False)]
-        while len(normal_apples) > apple_count:
-            for i in range(len(apples) - 1, -1, -1):
-                if not apples[i].get('special', False):
-                    apples.pop(i)
+        while normal_apple_count > apple_count:
+            for pos in reversed(list(apples)):
+                if not apples[pos].get('special', False):
+                    del apples[pos]
+                    normal_apple_count -= 1
                     break
-            normal_apples = [a for a in apples if not a.get('special', False)]
 
         # Add normal apples to meet count
-        while len(normal_apples) < apple_count:
-            pos = random_empty_position(sh, sw, snake, [a['pos'] for a in apples], obstacles)
+        while normal_apple_count < apple_count:
+            pos = random_empty_position(sh, sw, snake_set, apples.keys(), obstacle_set)
+            if pos is None:
+                break
             color = random_color()
-            apples.append({'pos': pos, 'color': color})
-            normal_apples = [a for a in apples if not a.get('special', False)]
+            apples[pos] = {'color': color}
+            normal_apple_count += 1
 
         # Spawn special apple every 21 points if none present
-        special_exists = any(a.get('special', False) for a in apples)
-        if score != 0 and score % 21 == 0 and not special_exists:
-            pos = random_empty_position(sh, sw, snake, [a['pos'] for a in apples], obstacles)
-            apples.append({'pos': pos, 'color': SPECIAL_APPLE_COLOR, 'special': True})
+        if score != 0 and score % 21 == 0 and not special_apple_present:
+            pos = random_empty_position(sh, sw, snake_set, apples.keys(), obstacle_set)
+            if pos is not None:
+                apples[pos] = {'color': SPECIAL_APPLE_COLOR, 'special': True}
+                special_apple_present = True
 
         while len(obstacles) > obstacle_count:
-            obstacles.pop()
+            pos = obstacles.pop()
+            obstacle_set.discard(pos)
+            blocked.discard(pos)
         while len(obstacles) < obstacle_count:
-            pos = random_empty_position(sh, sw, snake, [a['pos'] for a in apples], obstacles)
+            pos = random_empty_position(sh, sw, snake_set, apples.keys(), obstacle_set)
+            if pos is None:
+                break
             obstacles.append(pos)
+            obstacle_set.add(pos)
+            blocked.add(pos)
 
 
     spawn_apples_and_obstacles()
 
     while True:
-        now = time.time()
+        # Let getch block until the next move or redraw is due (or a key
+        # arrives) rather than polling in a sleep loop
+        if paused:
+            stdscr.timeout(100)
+        else:
+            next_event = min(last_move_time + current_delay, last_draw_time + timer_refresh_interval)
+            stdscr.timeout(max(0, math.ceil((next_event - time.time()) * 1000)))
 
         key = stdscr.getch()
+        now = time.time()
         if key != -1:
-            if key == ord('p'):
+            # A held key queues repeats faster than the snake moves, so read
+            # everything that's waiting and act on it once for this tick
+            stdscr.timeout(0)
+            toggle_pause = toggle_sound = False
+            turn = None
+            while key != -1:
+                if key == ord('p'):
+                    toggle_pause = not toggle_pause
+                elif key == ord('o'):
+                    toggle_sound = not toggle_sound
+                elif key in KEY_DIRECTION_MAP:
+                    new_dir = DIRECTIONS[KEY_DIRECTION_MAP[key]]
+                    new_head = (snake[0][0] + new_dir[0], snake[0][1] + new_dir[1])
+                    if len(snake) < 2 or new_head != snake[1]:
+                        turn = new_dir
+                    speed_boost = True
+                elif key in (ord('q'), 27):
+                    return score, int(now - start_time), sound_on, None
+                elif key == curses.KEY_RESIZE:
+                    update_layout()
+                    hy, hx = snake[0]
+                    if not (0 < hy < y_max and 0 < hx <= x_max):
+                        # The border moved onto the snake's head
+                        return score, int(now - start_time), sound_on, True
+                    # Drop apples and obstacles left outside a smaller board,
+                    # then top it back up so there's always something to eat
+                    board = set(board_cells(sh, sw))
+                    for pos in [pos for pos in apples if pos not in board]:
+                        if apples.pop(pos).get('special', False):
+                            special_apple_present = False
+                        else:
+                            normal_apple_count -= 1
+                    for pos in [pos for pos in obstacles if pos not in board]:
+                        obstacles.remove(pos)
+                        obstacle_set.discard(pos)
+                    blocked = set(border) | snake_set | obstacle_set
+                    spawn_apples_and_obstacles()
+                    controls_str = None  # right-aligned against the new width
+                    stdscr.clear()
+                    prev_frame = None
+                key = stdscr.getch()
+
+            if toggle_pause:
                 paused = not paused
-            elif key == ord('o'):
+                prev_frame = None  # repaint over the pause message
+            if toggle_sound:
                 sound_on = not sound_on
-            elif key in KEY_DIRECTION_MAP:
-                new_dir = DIRECTIONS[KEY_DIRECTION_MAP[key]]
-                new_head = [snake[0][0] + new_dir[0], snake[0][1] + new_dir[1]]
-                if len(snake) < 2 or new_head != snake[1]:
-                    dir_vec = new_dir
-                speed_boost = True
-            elif key in (ord('q'), 27):
-                return score, int(now - start_time), sound_on, None
+                controls_str = None
+            if turn is not None:
+                dir_vec = turn
         else:
             speed_boost = False
 
         if paused:
-            pause_msg = "Paused — press 'p' to resume"
             stdscr.attron(curses.A_REVERSE)
-            stdscr.addstr(sh // 2, sw // 2 - len(pause_msg)//2, pause_msg)
+            stdscr.addstr(pause_y, pause_x, pause_msg)
             stdscr.attroff(curses.A_REVERSE)
             stdscr.refresh()
-            time.sleep(0.1)
             continue
 
-        current_delay = max(min_delay, base_delay - (score // 5) * 0.01)
-        if speed_boost:
-            current_delay /= 3
+        current_delay = move_delay / 3 if speed_boost else move_delay
 
         if now - last_move_time >= current_delay:
             last_move_time = now
-            head = [snake[0][0] + dir_vec[0], snake[0][1] + dir_vec[1]]
+            head = (snake[0][0] + dir_vec[0], snake[0][1] + dir_vec[1])
 
             # Check collision with self, borders, obstacles
-            if (head in snake or
-                head[0] <= 0 or head[0] >= sh - 1 or
-                head[1] <= 0 or head[1] > sw - SEGMENT_WIDTH - 1 or
-                head in obstacles):
+            if head in blocked:
                 return score, int(now - start_time), sound_on, True  # Game over
 
-            snake.insert(0, head)
-
-            ate_apple_idx = None
-            for i, apple in enumerate(apples):
-                if apple['pos'] == head:
-                    ate_apple_idx = i
-                    break
+            snake.appendleft(head)
+            snake_set.add(head)
+            blocked.add(head)
 
-            if ate_apple_idx is not None:
-                apple = apples.pop(ate_apple_idx)
+            apple = apples.pop(head, None)
+            if apple is not None:
                 if apple.get('special', False):
                     score += 2
                     grow_segments += 2
+                    special_apple_present = False
                 else:
                     score += 1
                     grow_segments += 1
+                    normal_apple_count -= 1
+                score_str = None
+                move_delay = max(min_delay, base_delay - (score // 5) * 0.01)
                 if sound_on:
                     play_sound()
 
-                pos = random_empty_position(sh, sw, snake, [a['pos'] for a in apples], obstacles)
-                color = random_color()
-                apples.append({'pos': pos, 'color': color})
-
                 spawn_apples_and_obstacles()
 
             if grow_segments > 0:
                 grow_segments -= 1
             else:
-                snake.pop()
+                tail = snake.pop()
+                snake_set.discard(tail)
+                # After a shrink the body can lie across the new border, and
+                # the wall has to stay once the tail moves off it
+                if tail not in border:
+                    blocked.discard(tail)
+            dirty = True
 
         if now - last_draw_time >= timer_refresh_interval:
             last_draw_time = now
             elapsed = now - start_time
 
-            score_str = f"Score: {score}"
+            if score_str is None:
+                score_str = f"Score: {score}"
+            if controls_str is None:
+                controls_str = f"Pause (P)  Sound ({'ON' if sound_on else 'OFF'}) (O)  Quit (Q)"
+                right_pos = sw - len(controls_str) - 2
+
             mins = int(elapsed // 60)
             secs = int(elapsed % 60)
             millis = int((elapsed - int(elapsed)) * 1000)
             time_str = f"Time: {mins:02d}:{secs:02d}.{millis:03d}"
-            controls_str = f"Pause (P)  Sound ({'ON' if sound_on else 'OFF'}) (O)  Quit (Q)"
-
-            left_pos = 2
-            right_pos = sw - len(controls_str) - 2
             center_pos = (sw - len(time_str)) // 2
 
-            stdscr.erase()
-            stdscr.attron(curses.color_pair(10))  # border same color as snake
-            stdscr.border()
-            stdscr.attroff(curses.color_pair(10))
-
-            stdscr.attron(curses.color_pair(10) | curses.A_BOLD)
-            stdscr.addstr(0, left_pos, score_str)
-            stdscr.addstr(0, center_pos, time_str)
-            stdscr.addstr(0, right_pos, controls_str)
-            stdscr.attroff(curses.color_pair(10) | curses.A_BOLD)
-
-            for apple in apples:
-                y, x = apple['pos']
-                curses.init_pair(20 + apple['color'], apple['color'], -1)
-                stdscr.attron(curses.color_pair(20 + apple['color']))
-                stdscr.addstr(y, x, APPLE_CHAR if not apple.get('special', False) else SPECIAL_APPLE_CHAR)
-                stdscr.attroff(curses.color_pair(20 + apple['color']))
-
-            stdscr.attron(curses.color_pair(30))
-            for y, x in obstacles:
-                stdscr.addstr(y, x, OBSTACLE_CHAR)
-            stdscr.attroff(curses.color_pair(30))
-
-            stdscr.attron(curses.color_pair(10))
-            for y, x in snake:
-                stdscr.addstr(y, x, SNAKE_CHAR)
-            stdscr.attroff(curses.color_pair(10))
+            if dirty or prev_frame is None:
+                frame = new_frame(sh, sw)
+                frame_border(frame, border_attr)
+
+                # Group apples by look so each attribute is looked up once
+                apples_by_look = collections.defaultdict(list)
+                for pos, apple in apples.items():
+                    char = APPLE_CHAR if not apple.get('special', False) else SPECIAL_APPLE_CHAR
+                    apples_by_look[char, apple['color']].append(pos)
+                for (char, color), cells in apples_by_look.items():
+                    frame_cells(frame, cells, char, curses.color_pair(20 + color))
+
+                frame_cells(frame, obstacles, OBSTACLE_CHAR, curses.color_pair(30))
+                frame_cells(frame, snake, SNAKE_CHAR, curses.color_pair(10))
+                dirty = False
+            else:
+                # Nothing on the board moved, so reuse its rows and only
+                # rebuild the HUD line
+                frame = list(prev_frame)
 
-            stdscr.refresh()
+            frame[0] = list(top_border)
+            frame_put(frame, 0, left_pos, score_str, hud_attr)
+            frame_put(frame, 0, center_pos, time_str, hud_attr)
+            frame_put(frame, 0, right_pos, controls_str, hud_attr)
 
-        time.sleep(0.01)
+            flush_frame(stdscr, frame, prev_frame)
+            prev_frame = frame
 
 
 def main(stdscr):